@@ -14,36 +14,32 @@ const COLORS = {
   other: '#B0BEC5'
 };
 
+const DAY_NAMES = ['Sun', 'Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat'];
+const MONTH_NAMES = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec'];
+
 export function AnalyticsCharts({ incidents, hotspots }: AnalyticsChartsProps) {
-  const crimeTypeData = Object.entries(
-    incidents.reduce((acc, inc) => {
-      acc[inc.incidentType] = (acc[inc.incidentType] || 0) + 1;
-      return acc;
-    }, {} as Record<string, number>)
-  ).map(([name, value]) => ({ name, value }));
+  const crimeTypeCounts: Record<string, number> = {};
+  const severityCounts: Record<string, number> = {};
+  const hourlyCounts = new Array<number>(24).fill(0);
+  const dailyCounts = new Array<number>(7).fill(0);
+  const monthlyCounts = new Array<number>(12).fill(0);
+  incidents.forEach(inc => {
+    crimeTypeCounts[inc.incidentType] = (crimeTypeCounts[inc.incidentType] || 0) + 1;
+    severityCounts[inc.severity] = (severityCounts[inc.severity] || 0) + 1;
+    hourlyCounts[inc.hourOfDay]++;
+    dailyCounts[inc.dayOfWeek]++;
+    monthlyCounts[inc.occurredAt.getMonth()]++;
+  });
 
-  const severityData = Object.entries(
-    incidents.reduce((acc, inc) => {
-      acc[inc.severity] = (acc[inc.severity] || 0) + 1;
-      return acc;
-    }, {} as Record<string, number>)
-  ).map(([name, value]) => ({ name, value }));
+  const crimeTypeData = Object.entries(crimeTypeCounts).map(([name, value]) => ({ name, value }));
 
-  const hourlyData = Array.from({ length: 24 }, (_, hour) => {
-    const count = incidents.filter(inc => inc.hourOfDay === hour).length;
-    return { hour: `${hour}:00`, incidents: count };
-  });
+  const severityData = Object.entries(severityCounts).map(([name, value]) => ({ name, value }));
 
-  const dailyData = ['Sun', 'Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat'].map((day, index) => {
-    const count = incidents.filter(inc => inc.dayOfWeek === index).length;
-    return { day, incidents: count };
-  });
+  const hourlyData = hourlyCounts.map((count, hour) => ({ hour: `${hour}:00`, incidents: count }));
 
-  const monthlyData = Array.from({ length: 12 }, (_, month) => {
-    const count = incidents.filter(inc => inc.occurredAt.getMonth() === month).length;
-    const monthNames = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec'];
-    return { month: monthNames[month], incidents: count };
-  });
+  const dailyData = DAY_NAMES.map((day, index) => ({ day, incidents: dailyCounts[index] }));
+
+  const monthlyData = MONTH_NAMES.map((month, index) => ({ month, incidents: monthlyCounts[index] }));
 
   return (
     <div className="space-y-6">
@@ -7,7 +7,7 @@ import { SOSMonitor } from './SOSMonitor';
 import { generateMockCrimeIncidents, generateMockHotspots, generateMockPatrolPlans, generateMockSOSRequests } from '../../services/mockData';
 import { predictHotspots } from '../../services/predictionService';
 import { useAuth } from '../../context/AuthContext';
-import { CrimeHotspot, CrimeIncident } from '../../types';
+import { CrimeHotspot, CrimeIncident, PatrolPlan, SOSRequest } from '../../types';
 
 type Tab = 'map' | 'analytics' | 'patrols' | 'sos';
 
@@ -16,6 +16,8 @@ export function PoliceDashboard() {
   const [activeTab, setActiveTab] = useState<Tab>('map');
   const [incidents, setIncidents] = useState<CrimeIncident[]>([]);
   const [hotspots, setHotspots] = useState<CrimeHotspot[]>([]);
+  const [patrolPlans, setPatrolPlans] = useState<PatrolPlan[]>([]);
+  const [sosRequests, setSosRequests] = useState<SOSRequest[]>([]);
   const [showIncidents, setShowIncidents] = useState(false);
 
   useEffect(() => {
@@ -27,15 +29,21 @@ export function PoliceDashboard() {
     const mockHotspots = generateMockHotspots(mockIncidents);
 
     setHotspots([...predicted.slice(0, 3), ...mockHotspots]);
+    setPatrolPlans(generateMockPatrolPlans());
+    setSosRequests(generateMockSOSRequests());
   }, []);
 
-  const criticalHotspots = hotspots.filter(h => h.riskLevel === 'critical').length;
-  const highRiskHotspots = hotspots.filter(h => h.riskLevel === 'high').length;
+  const riskLevelCounts = hotspots.reduce((acc, h) => {
+    acc[h.riskLevel]++;
+    return acc;
+  }, { low: 0, moderate: 0, high: 0, critical: 0 } as Record<CrimeHotspot['riskLevel'], number>);
+  const criticalHotspots = riskLevelCounts.critical;
+  const highRiskHotspots = riskLevelCounts.high;
   const totalIncidents = incidents.length;
-  const recentIncidents = incidents.filter(i => {
-    const hoursDiff = (Date.now() - i.occurredAt.getTime()) / (1000 * 60 * 60);
-    return hoursDiff <= 24;
-  }).length;
+  const recentCutoff = Date.now() - 24 * 60 * 60 * 1000;
+  const recentIncidents = incidents.reduce((count, i) =>
+    i.occurredAt.getTime() >= recentCutoff ? count + 1 : count, 0
+  );
 
   const handleGenerateReport = () => {
     const report = {
@@ -248,8 +256,8 @@ export function PoliceDashboard() {
             )}
 
             {activeTab === 'analytics' && <AnalyticsCharts incidents={incidents} hotspots={hotspots} />}
-            {activeTab === 'patrols' && <PatrolManagement plans={generateMockPatrolPlans()} hotspots={hotspots} />}
-            {activeTab === 'sos' && <SOSMonitor requests={generateMockSOSRequests()} />}
+            {activeTab === 'patrols' && <PatrolManagement plans={patrolPlans} hotspots={hotspots} />}
+            {activeTab === 'sos' && <SOSMonitor requests={sosRequests} />}
           </div>
         </div>
       </div>
@@ -20,6 +20,11 @@ export function SOSMonitor({ requests }: SOSMonitorProps) {
     cancelled: 'bg-gray-600 text-white'
   };
 
+  const statusCounts = requests.reduce((acc, r) => {
+    acc[r.status]++;
+    return acc;
+  }, { pending: 0, dispatched: 0, resolved: 0, cancelled: 0 } as Record<SOSRequest['status'], number>);
+
   const sortedRequests = [...requests].sort((a, b) => {
     const priorityOrder = { critical: 0, high: 1, medium: 2, low: 3 };
     return priorityOrder[a.priority] - priorityOrder[b.priority];
@@ -32,11 +37,11 @@ export function SOSMonitor({ requests }: SOSMonitorProps) {
         <div className="flex gap-4 text-sm">
           <div className="flex items-center gap-2">
             <div className="w-3 h-3 bg-[#DC3545] rounded-full animate-pulse"></div>
-            <span className="text-gray-300">{requests.filter(r => r.status === 'pending').length} Pending</span>
+            <span className="text-gray-300">{statusCounts.pending} Pending</span>
           </div>
           <div className="flex items-center gap-2">
             <div className="w-3 h-3 bg-[#4A90E2] rounded-full"></div>
-            <span className="text-gray-300">{requests.filter(r => r.status === 'dispatched').length} Dispatched</span>
+            <span className="text-gray-300">{statusCounts.dispatched} Dispatched</span>
           </div>
         </div>
       </div>
@@ -6,8 +6,24 @@ interface ClusterPoint {
   incidents: CrimeIncident[];
 }
 
+interface NeighborGraph {
+  offsets: Int32Array;
+  indices: Int32Array;
+}
+
+const EARTH_RADIUS_KM = 6371;
+// Incidents closer than ~1m share one DBSCAN point weighted by their count.
+const COORDINATE_PRECISION = 1e5;
+
+const SEVERITY_SCORES: Record<CrimeIncident['severity'], number> = {
+  low: 10,
+  medium: 30,
+  high: 60,
+  critical: 100
+};
+
 function calculateDistance(lat1: number, lng1: number, lat2: number, lng2: number): number {
-  const R = 6371;
+  const R = EARTH_RADIUS_KM;
   const dLat = (lat2 - lat1) * Math.PI / 180;
   const dLng = (lng2 - lng1) * Math.PI / 180;
   const a = Math.sin(dLat / 2) * Math.sin(dLat / 2) +
@@ -17,50 +33,137 @@ function calculateDistance(lat1: number, lng1: number, lat2: number, lng2: numbe
   return R * c;
 }
 
+function toUnitSphere(lat: number, lng: number): [number, number, number] {
+  const latRad = lat * Math.PI / 180;
+  const lngRad = lng * Math.PI / 180;
+  const cosLat = Math.cos(latRad);
+  return [cosLat * Math.cos(lngRad), cosLat * Math.sin(lngRad), Math.sin(latRad)];
+}
+
+function collapseDuplicateLocations(incidents: CrimeIncident[]): CrimeIncident[][] {
+  const groupsByKey = new Map<string, CrimeIncident[]>();
+
+  incidents.forEach(incident => {
+    const key = `${Math.round(incident.latitude * COORDINATE_PRECISION)}:${Math.round(incident.longitude * COORDINATE_PRECISION)}`;
+    const group = groupsByKey.get(key);
+    if (group) group.push(incident);
+    else groupsByKey.set(key, [incident]);
+  });
+
+  return Array.from(groupsByKey.values());
+}
+
+// Chord length is monotonic in great-circle distance, so squared chords can
+// replace haversine in the neighbor test without per-pair trigonometry.
+// Points are bucketed into cubes of side maxChord, so every neighbor of a
+// point lies in one of the 27 cubes around it.
+function buildNeighborGraph(coords: Float32Array, maxChord: number): NeighborGraph {
+  const count = coords.length / 3;
+  const maxChordSq = maxChord * maxChord;
+  const cellSize = Math.max(maxChord, Number.EPSILON);
+  const cells = new Map<string, { cell: [number, number, number]; members: number[] }>();
+
+  for (let i = 0; i < count; i++) {
+    const cell: [number, number, number] = [
+      Math.floor(coords[i * 3] / cellSize),
+      Math.floor(coords[i * 3 + 1] / cellSize),
+      Math.floor(coords[i * 3 + 2] / cellSize)
+    ];
+    const key = cell.join(':');
+    const entry = cells.get(key);
+    if (entry) entry.members.push(i);
+    else cells.set(key, { cell, members: [i] });
+  }
+
+  const rows: number[][] = new Array(count);
+
+  cells.forEach(({ cell: [cx, cy, cz], members }) => {
+    const candidates: number[] = [];
+    for (let x = cx - 1; x <= cx + 1; x++) {
+      for (let y = cy - 1; y <= cy + 1; y++) {
+        for (let z = cz - 1; z <= cz + 1; z++) {
+          cells.get(`${x}:${y}:${z}`)?.members.forEach(j => candidates.push(j));
+        }
+      }
+    }
+    candidates.sort((a, b) => a - b);
+
+    members.forEach(i => {
+      const xi = coords[i * 3];
+      const yi = coords[i * 3 + 1];
+      const zi = coords[i * 3 + 2];
+      rows[i] = candidates.filter(j => {
+        const dx = xi - coords[j * 3];
+        const dy = yi - coords[j * 3 + 1];
+        const dz = zi - coords[j * 3 + 2];
+        return dx * dx + dy * dy + dz * dz <= maxChordSq;
+      });
+    });
+  });
+
+  const offsets = new Int32Array(count + 1);
+  for (let i = 0; i < count; i++) offsets[i + 1] = offsets[i] + rows[i].length;
+
+  const indices = new Int32Array(offsets[count]);
+  rows.forEach((row, i) => indices.set(row, offsets[i]));
+
+  return { offsets, indices };
+}
+
 export function performDBSCAN(incidents: CrimeIncident[], epsilon: number = 0.5, minPoints: number = 10): ClusterPoint[] {
   const clusters: ClusterPoint[] = [];
-  const visited = new Set<string>();
-  const clustered = new Set<string>();
+  const groups = collapseDuplicateLocations(incidents);
+  const visited = new Uint8Array(groups.length);
+  const clustered = new Uint8Array(groups.length);
+  // float32 resolves unit-sphere coordinates to under a metre, far below epsilon.
+  const coords = new Float32Array(groups.length * 3);
+  groups.forEach((group, index) => {
+    coords.set(toUnitSphere(group[0].latitude, group[0].longitude), index * 3);
+  });
 
-  incidents.forEach(incident => {
-    if (visited.has(incident.id)) return;
-    visited.add(incident.id);
+  const maxChord = 2 * Math.sin(epsilon / EARTH_RADIUS_KM / 2);
+  const { offsets, indices } = buildNeighborGraph(coords, maxChord);
+  const isCore = groups.map((_, index) => {
+    let weight = 0;
+    for (let k = offsets[index]; k < offsets[index + 1]; k++) weight += groups[indices[k]].length;
+    return weight >= minPoints;
+  });
 
-    const neighbors = incidents.filter(other =>
-      calculateDistance(incident.latitude, incident.longitude, other.latitude, other.longitude) <= epsilon
-    );
+  groups.forEach((_, index) => {
+    if (visited[index]) return;
+    visited[index] = 1;
 
-    if (neighbors.length >= minPoints) {
+    if (isCore[index]) {
       const clusterIncidents: CrimeIncident[] = [];
-      const queue = [...neighbors];
-
-      while (queue.length > 0) {
-        const current = queue.shift()!;
-        if (clustered.has(current.id)) continue;
-        clustered.add(current.id);
-        clusterIncidents.push(current);
-
-        const currentNeighbors = incidents.filter(other =>
-          calculateDistance(current.latitude, current.longitude, other.latitude, other.longitude) <= epsilon
-        );
-
-        if (currentNeighbors.length >= minPoints) {
-          currentNeighbors.forEach(n => {
-            if (!visited.has(n.id)) {
-              visited.add(n.id);
+      let latSum = 0;
+      let lngSum = 0;
+      const queue = Array.from(indices.subarray(offsets[index], offsets[index + 1]));
+
+      for (let head = 0; head < queue.length; head++) {
+        const currentIndex = queue[head];
+        if (clustered[currentIndex]) continue;
+        clustered[currentIndex] = 1;
+        groups[currentIndex].forEach(current => {
+          clusterIncidents.push(current);
+          latSum += current.latitude;
+          lngSum += current.longitude;
+        });
+
+        if (isCore[currentIndex]) {
+          for (let k = offsets[currentIndex]; k < offsets[currentIndex + 1]; k++) {
+            const n = indices[k];
+            if (!visited[n]) {
+              visited[n] = 1;
               queue.push(n);
             }
-          });
+          }
         }
       }
 
       if (clusterIncidents.length > 0) {
-        const avgLat = clusterIncidents.reduce((sum, i) => sum + i.latitude, 0) / clusterIncidents.length;
-        const avgLng = clusterIncidents.reduce((sum, i) => sum + i.longitude, 0) / clusterIncidents.length;
-
         clusters.push({
-          lat: avgLat,
-          lng: avgLng,
+          lat: latSum / clusterIncidents.length,
+          lng: lngSum / clusterIncidents.length,
           incidents: clusterIncidents
         });
       }
@@ -71,36 +174,31 @@ export function performDBSCAN(incidents: CrimeIncident[], epsilon: number = 0.5,
 }
 
 export function predictHotspots(incidents: CrimeIncident[], currentHour: number, currentDay: number): CrimeHotspot[] {
-  const recentIncidents = incidents.filter(incident => {
-    const daysDiff = (Date.now() - incident.occurredAt.getTime()) / (1000 * 60 * 60 * 24);
-    return daysDiff <= 30;
-  });
+  const now = Date.now();
+  const recentCutoff = now - 30 * 24 * 60 * 60 * 1000;
+  const recentIncidents = incidents.filter(incident => incident.occurredAt.getTime() >= recentCutoff);
 
   const clusters = performDBSCAN(recentIncidents, 0.5, 8);
 
   return clusters.map((cluster, index) => {
-    const severityScores = {
-      low: 10,
-      medium: 30,
-      high: 60,
-      critical: 100
-    };
-
-    const baseRiskScore = cluster.incidents.reduce((sum, inc) =>
-      sum + severityScores[inc.severity], 0
-    ) / cluster.incidents.length;
+    let severitySum = 0;
+    let timeMatches = 0;
+    let dayMatches = 0;
+    let weatherMatches = 0;
+    const crimeTypeCounts: Record<string, number> = {};
 
-    const timeMatchScore = cluster.incidents.filter(inc =>
-      Math.abs(inc.hourOfDay - currentHour) <= 2
-    ).length / cluster.incidents.length;
+    cluster.incidents.forEach(inc => {
+      severitySum += SEVERITY_SCORES[inc.severity];
+      if (Math.abs(inc.hourOfDay - currentHour) <= 2) timeMatches++;
+      if (inc.dayOfWeek === currentDay) dayMatches++;
+      if (inc.weatherCondition === 'rain' || inc.weatherCondition === 'fog') weatherMatches++;
+      crimeTypeCounts[inc.incidentType] = (crimeTypeCounts[inc.incidentType] || 0) + 1;
+    });
 
-    const dayMatchScore = cluster.incidents.filter(inc =>
-      inc.dayOfWeek === currentDay
-    ).length / cluster.incidents.length;
-
-    const weatherImpactScore = cluster.incidents.filter(inc =>
-      inc.weatherCondition === 'rain' || inc.weatherCondition === 'fog'
-    ).length / cluster.incidents.length;
+    const baseRiskScore = severitySum / cluster.incidents.length;
+    const timeMatchScore = timeMatches / cluster.incidents.length;
+    const dayMatchScore = dayMatches / cluster.incidents.length;
+    const weatherImpactScore = weatherMatches / cluster.incidents.length;
 
     const finalRiskScore = Math.min(100,
       baseRiskScore * 0.5 +
@@ -115,19 +213,13 @@ export function predictHotspots(incidents: CrimeIncident[], currentHour: number,
     else if (finalRiskScore < 80) riskLevel = 'high';
     else riskLevel = 'critical';
 
-    const crimeTypeCounts = cluster.incidents.reduce((acc, inc) => {
-      acc[inc.incidentType] = (acc[inc.incidentType] || 0) + 1;
-      return acc;
-    }, {} as Record<string, number>);
-
     const predictedTypes = Object.entries(crimeTypeCounts)
       .sort(([, a], [, b]) => b - a)
       .slice(0, 3)
       .map(([type]) => type);
 
-    const now = new Date();
-    const activeFrom = new Date(now.getTime());
-    const activeUntil = new Date(now.getTime() + 12 * 60 * 60 * 1000);
+    const activeFrom = new Date(now);
+    const activeUntil = new Date(now + 12 * 60 * 60 * 1000);
 
     return {
       id: `predicted-hotspot-${index}`,